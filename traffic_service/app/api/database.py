@@ -1,42 +1,59 @@
-import os
-
-from dotenv import dotenv_values
-from sqlalchemy import create_engine
+import asyncio
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 
-config = dotenv_values(".env")
+from app.config import get_settings
 
-DB_USER = config.get("DB_DEV_USER") or os.getenv("DB_DEV_USER", "admin")
-DB_PASSWORD = config.get("DB_DEV_PASSWORD") or os.getenv(
-    "DB_DEV_PASSWORD", "admin"
-)
-DB_HOST = config.get("DB_DEV_HOST") or os.getenv("DB_DEV_HOST", "db")
-DB_PORT = config.get("DB_DEV_PORT") or os.getenv("DB_DEV_PORT", "5432")
-DB_NAME = config.get("DB_DEV_TRAFFIC_NAME") or os.getenv(
-    "DB_DEV_TRAFFIC_NAME", "gos_traffic"
-)
+logger = logging.getLogger(__name__)
 
-DATABASE_URL = (
-    f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-)
+settings = get_settings()
+
+DATABASE_URL = settings.database_url
 
-engine = create_engine(
+engine = create_async_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False}
-    if "sqlite" in DATABASE_URL
-    else {},
+    pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=0,
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# One session per request task; released by the session middleware in main.py
+SessionLocal = async_scoped_session(
+    async_sessionmaker(engine, autoflush=False, expire_on_commit=False),
+    scopefunc=asyncio.current_task,
+)
 
 Base = declarative_base()
 
 
-# Dependency to get DB session
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+async def warm_connection_pool():
+    """
+    Open every pooled connection up front so the first requests served by
+    a worker don't pay for connection setup and authentication.
+    """
+    connections = []
+
+    async def _ping():
+        connection = await engine.connect()
+        connections.append(connection)
+        await connection.execute(text("SELECT 1"))
+
+    # Open the connections concurrently and hold them all until every ping
+    # is done, otherwise the pool would hand the same one back each time
+    results = await asyncio.gather(
+        *(_ping() for _ in range(settings.db_pool_size)),
+        return_exceptions=True,
+    )
+    for connection in connections:
+        await connection.close()
+
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        logger.warning(f"Failed to warm database connection pool: {errors[0]}")
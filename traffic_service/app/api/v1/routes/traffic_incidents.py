@@ -1,18 +1,18 @@
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.engine import Row
 
-from app.kafka.producer import kafka_producer
+from app.kafka.producer import get_kafka_producer
 
-from ...database import get_db
+from ...database import SessionLocal
 from ..models import TrafficIncident as TrafficIncidentModel
 from ..schemas.traffic_schemas import (
     ErrorResponse,
     StatusUpdateRequest,
-    TrafficIncident,
     TrafficIncidentCreate,
     TrafficIncidentResponse,
     TrafficIncidentsResponse,
@@ -24,24 +24,32 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/traffic/incidents", tags=["traffic-incidents"])
 
 
-def convert_db_to_schema(db_incident: TrafficIncidentModel) -> TrafficIncident:
-    """Convert database model to Pydantic schema"""
-    return TrafficIncident(
-        id=db_incident.id,
-        type=db_incident.type,
-        severity=db_incident.severity,
-        status=db_incident.status,
-        location={"lat": db_incident.latitude, "lng": db_incident.longitude},
-        description=db_incident.description,
-        address=db_incident.address,
-        affected_lanes=db_incident.affected_lanes,
-        estimated_duration=db_incident.estimated_duration,
-        reported_by=db_incident.reported_by,
-        created_at=db_incident.created_at,
-        updated_at=db_incident.updated_at,
-        votes_confirm=db_incident.votes_confirm,
-        votes_dispute=db_incident.votes_dispute,
-    )
+def serialize_incident(db_incident: Union[TrafficIncidentModel, Row]) -> dict:
+    """
+    Build the response payload for an incident.
+
+    Enum columns are reduced to their string values here so responses can be
+    serialized directly, without re-validating every row through Pydantic.
+    """
+    return {
+        "id": db_incident.id,
+        "type": db_incident.type.value,
+        "severity": db_incident.severity.value,
+        "status": db_incident.status.value,
+        "location": {
+            "lat": db_incident.latitude,
+            "lng": db_incident.longitude,
+        },
+        "description": db_incident.description,
+        "address": db_incident.address,
+        "affected_lanes": db_incident.affected_lanes,
+        "estimated_duration": db_incident.estimated_duration,
+        "reported_by": db_incident.reported_by,
+        "created_at": db_incident.created_at,
+        "updated_at": db_incident.updated_at,
+        "votes_confirm": db_incident.votes_confirm,
+        "votes_dispute": db_incident.votes_dispute,
+    }
 
 
 @router.post(
@@ -51,9 +59,7 @@ def convert_db_to_schema(db_incident: TrafficIncidentModel) -> TrafficIncident:
     summary="Report Traffic Incident",
     description="Report a new traffic incident",
 )
-async def report_incident(
-    incident_data: TrafficIncidentCreate, db: Session = Depends(get_db)
-):
+async def report_incident(incident_data: TrafficIncidentCreate):
     """
     Report a traffic incident.
 
@@ -65,52 +71,48 @@ async def report_incident(
     - **affected_lanes**: Information about affected lanes (optional)
     - **estimated_duration**: Estimated duration of the incident (optional)
     """
-    try:
-        service = TrafficIncidentService(db)
-        db_incident = service.create_incident(incident_data)
-        incident_schema = convert_db_to_schema(db_incident)
-
-        # Publish traffic report to Kafka
-        try:
-            kafka_message = {
-                "reportId": str(db_incident.id),
-                "incidentType": db_incident.type,
-                "severity": db_incident.severity,
-                "location": {
-                    "lat": db_incident.latitude,
-                    "lng": db_incident.longitude,
-                    "address": db_incident.address,
-                },
-                "description": db_incident.description,
-                "reporter": {
-                    "userId": db_incident.reported_by,
-                    "username": db_incident.reported_by,
-                },
-                "timestamp": datetime.utcnow().isoformat(),
-                "affectedUsers": [],
-            }
-
-            kafka_success = kafka_producer.send_traffic_report(kafka_message)
-            if kafka_success:
-                logger.info(f"Traffic report sent to Kafka: {db_incident.id}")
-            else:
-                logger.warning(
-                    f"Failed to send traffic report to Kafka: {db_incident.id}"
-                )
-        except Exception as kafka_error:
-            # Log but don't fail the request if Kafka fails
-            logger.error(f"Kafka publishing error: {kafka_error}")
-
-        return TrafficIncidentResponse(
-            message="Traffic incident reported successfully",
-            data=incident_schema,
-        )
+    service = TrafficIncidentService(SessionLocal())
+    db_incident = await service.create_incident(incident_data)
+    incident = serialize_incident(db_incident)
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to report incident: {str(e)}",
-        )
+    # Publish traffic report to Kafka
+    try:
+        kafka_message = {
+            "reportId": str(db_incident.id),
+            "incidentType": db_incident.type,
+            "severity": db_incident.severity,
+            "location": {
+                "lat": db_incident.latitude,
+                "lng": db_incident.longitude,
+                "address": db_incident.address,
+            },
+            "description": db_incident.description,
+            "reporter": {
+                "userId": db_incident.reported_by,
+                "username": db_incident.reported_by,
+            },
+            "timestamp": datetime.utcnow().isoformat(),
+            "affectedUsers": [],
+        }
+
+        kafka_success = get_kafka_producer().send_traffic_report(kafka_message)
+        if kafka_success:
+            logger.info(f"Traffic report queued for Kafka: {db_incident.id}")
+        else:
+            logger.warning(
+                f"Failed to send traffic report to Kafka: {db_incident.id}"
+            )
+    except Exception as kafka_error:
+        # Log but don't fail the request if Kafka fails
+        logger.error(f"Kafka publishing error: {kafka_error}")
+
+    return ORJSONResponse(
+        {
+            "success": True,
+            "message": "Traffic incident reported successfully",
+            "data": incident,
+        }
+    )
 
 
 @router.get(
@@ -136,7 +138,6 @@ async def get_incidents(
         100, description="Maximum number of incidents to return", le=500
     ),
     offset: int = Query(0, description="Number of incidents to skip"),
-    db: Session = Depends(get_db),
 ):
     """
     Get traffic incidents with optional filtering.
@@ -145,37 +146,33 @@ async def get_incidents(
     - If no location: returns all incidents (with pagination)
     - **status**: Filter by incident status (active, resolved, etc.)
     """
-    try:
-        service = TrafficIncidentService(db)
-
-        if lat is not None and lng is not None:
-            db_incidents = service.get_incidents_by_location(
-                latitude=lat,
-                longitude=lng,
-                radius_km=radius,
-                status_filter=status,
-                limit=limit,
-            )
-        else:
-            db_incidents = service.get_all_incidents(
-                status_filter=status, limit=limit, offset=offset
-            )
-
+    service = TrafficIncidentService(SessionLocal())
+
+    if lat is not None and lng is not None:
+        db_incidents = await service.get_incidents_by_location(
+            latitude=lat,
+            longitude=lng,
+            radius_km=radius,
+            status_filter=status,
+            limit=limit,
+        )
+        incidents = [serialize_incident(incident) for incident in db_incidents]
+    else:
+        db_incidents = await service.get_all_incidents(
+            status_filter=status, limit=limit, offset=offset
+        )
         incidents = [
-            convert_db_to_schema(incident) for incident in db_incidents
+            serialize_incident(incident) async for incident in db_incidents
         ]
 
-        return TrafficIncidentsResponse(
-            message="Traffic incidents retrieved successfully",
-            data=incidents,
-            total_count=len(incidents),
-        )
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get incidents: {str(e)}",
-        )
+    return ORJSONResponse(
+        {
+            "success": True,
+            "message": "Traffic incidents retrieved successfully",
+            "data": incidents,
+            "total_count": len(incidents),
+        }
+    )
 
 
 @router.get(
@@ -185,32 +182,27 @@ async def get_incidents(
     summary="Get Specific Incident",
     description="Get details of a specific traffic incident",
 )
-async def get_incident(incident_id: str, db: Session = Depends(get_db)):
+async def get_incident(incident_id: str):
     """Get a specific traffic incident by ID"""
-    try:
-        service = TrafficIncidentService(db)
-        db_incident = service.get_incident(incident_id)
-
-        if not db_incident:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Incident not found",
-            )
-
-        incident_schema = convert_db_to_schema(db_incident)
+    service = TrafficIncidentService(SessionLocal())
+    db_incident = await service.get_incident(incident_id)
 
-        return TrafficIncidentResponse(
-            message="Incident retrieved successfully", data=incident_schema
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not db_incident:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get incident: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Incident not found",
         )
 
+    incident = serialize_incident(db_incident)
+
+    return ORJSONResponse(
+        {
+            "success": True,
+            "message": "Incident retrieved successfully",
+            "data": incident,
+        }
+    )
+
 
 @router.put(
     "/{incident_id}/vote",
@@ -219,37 +211,30 @@ async def get_incident(incident_id: str, db: Session = Depends(get_db)):
     summary="Vote on Incident",
     description="Vote to confirm or dispute a traffic incident",
 )
-async def vote_on_incident(
-    incident_id: str, vote_data: VoteRequest, db: Session = Depends(get_db)
-):
+async def vote_on_incident(incident_id: str, vote_data: VoteRequest):
     """
     Vote on a traffic incident to help verify its accuracy.
 
     - **vote_type**: 'confirm' or 'dispute'
     - **user_id**: ID of the user voting (optional, for tracking)
     """
-    try:
-        service = TrafficIncidentService(db)
-
-        _ = service.vote_on_incident(
-            incident_id, vote_data.vote_type, vote_data.user_id
-        )
+    service = TrafficIncidentService(SessionLocal())
 
-        # Get updated incident
-        db_incident = service.get_incident(incident_id)
-        incident_schema = convert_db_to_schema(db_incident)
+    _ = await service.vote_on_incident(
+        incident_id, vote_data.vote_type, vote_data.user_id
+    )
 
-        return TrafficIncidentResponse(
-            message="Vote recorded successfully", data=incident_schema
-        )
+    # Get updated incident
+    db_incident = await service.get_incident(incident_id)
+    incident = serialize_incident(db_incident)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to record vote: {str(e)}",
-        )
+    return ORJSONResponse(
+        {
+            "success": True,
+            "message": "Vote recorded successfully",
+            "data": incident,
+        }
+    )
 
 
 @router.put(
@@ -262,7 +247,6 @@ async def vote_on_incident(
 async def update_incident_status(
     incident_id: str,
     status_update: StatusUpdateRequest,
-    db: Session = Depends(get_db),
 ):
     """
     Update the status of a traffic incident.
@@ -270,34 +254,30 @@ async def update_incident_status(
     - **status**: New status ('active', 'resolved', 'verified', 'disputed')
     - **updated_by**: ID of user/system updating the status (optional)
     """
-    try:
-        service = TrafficIncidentService(db)
-
-        db_incident = service.update_incident_status(
-            incident_id, status_update.status.value, status_update.updated_by
-        )
+    service = TrafficIncidentService(SessionLocal())
 
-        if not db_incident:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Incident not found",
-            )
-
-        incident_schema = convert_db_to_schema(db_incident)
-
-        return TrafficIncidentResponse(
-            message=f"Incident status updated to {status_update.status.value}",
-            data=incident_schema,
-        )
+    db_incident = await service.update_incident_status(
+        incident_id, status_update.status.value, status_update.updated_by
+    )
 
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not db_incident:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update incident status: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Incident not found",
         )
 
+    incident = serialize_incident(db_incident)
+
+    return ORJSONResponse(
+        {
+            "success": True,
+            "message": (
+                f"Incident status updated to {status_update.status.value}"
+            ),
+            "data": incident,
+        }
+    )
+
 
 @router.post(
     "/route-check",
@@ -311,36 +291,27 @@ async def check_route_incidents(
     buffer_km: float = Query(
         1.0, description="Buffer distance in kilometers around route"
     ),
-    db: Session = Depends(get_db),
 ):
     """Get traffic incidents along a route"""
-    try:
-        service = TrafficIncidentService(db)
-
-        coordinates = route_data.get("coordinates", [])
-        if not coordinates:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Route coordinates are required",
-            )
-
-        db_incidents = service.get_incidents_along_route(
-            coordinates, buffer_km
-        )
-        incidents = [
-            convert_db_to_schema(incident) for incident in db_incidents
-        ]
-
-        return TrafficIncidentsResponse(
-            message="Route incidents retrieved successfully",
-            data=incidents,
-            total_count=len(incidents),
-        )
+    service = TrafficIncidentService(SessionLocal())
 
-    except HTTPException:
-        raise
-    except Exception as e:
+    coordinates = route_data.get("coordinates", [])
+    if not coordinates:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to check route incidents: {str(e)}",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Route coordinates are required",
         )
+
+    db_incidents = await service.get_incidents_along_route(
+        coordinates, buffer_km
+    )
+    incidents = [serialize_incident(incident) for incident in db_incidents]
+
+    return ORJSONResponse(
+        {
+            "success": True,
+            "message": "Route incidents retrieved successfully",
+            "data": incidents,
+            "total_count": len(incidents),
+        }
+    )
@@ -8,8 +8,18 @@ from passlib.context import CryptContext
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
 
+# bcrypt hash of a random string that no password matches. Checked when a
+# user has no stored hash so unknown usernames cost the same as known ones.
+DUMMY_PASSWORD_HASH = (
+    "$2b$12$3ttTqkeKee.PLKUKcBkRju3RsunimeAua4.Tuch5IFJ3/npYCci62"
+)
+
 
 def verify_password(plain_password: str, hashed_password: str):
+    if not hashed_password:
+        pwd_context.verify(plain_password, DUMMY_PASSWORD_HASH)
+        return False
+
     try:
         return pwd_context.verify(plain_password, hashed_password)
     except Exception as ex:
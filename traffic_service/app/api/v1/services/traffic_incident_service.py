@@ -1,74 +1,100 @@
 import math
-import uuid
+import secrets
+import time
 from datetime import datetime
 from typing import List, Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, insert, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 
 from ..enums import IncidentStatus
 from ..models import IncidentVote, TrafficIncident
 from ..schemas.traffic_schemas import TrafficIncidentCreate
 
+EARTH_RADIUS_KM = 6371
+
+# Columns read by the incident endpoints. Read paths select these as plain
+# rows instead of full ORM instances to skip identity-map bookkeeping.
+_INCIDENT_COLUMNS = (
+    TrafficIncident.id,
+    TrafficIncident.type,
+    TrafficIncident.severity,
+    TrafficIncident.status,
+    TrafficIncident.latitude,
+    TrafficIncident.longitude,
+    TrafficIncident.description,
+    TrafficIncident.address,
+    TrafficIncident.affected_lanes,
+    TrafficIncident.estimated_duration,
+    TrafficIncident.reported_by,
+    TrafficIncident.created_at,
+    TrafficIncident.updated_at,
+    TrafficIncident.votes_confirm,
+    TrafficIncident.votes_dispute,
+)
+
 
 class TrafficIncidentService:
     """Service for managing traffic incidents"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_incident(
+    async def create_incident(
         self, incident_data: TrafficIncidentCreate
-    ) -> TrafficIncident:
+    ) -> Row:
         """Create a new traffic incident"""
         incident_id = (
-            f"incident_{uuid.uuid4().hex[:8]}_"
-            f"{int(datetime.now().timestamp())}"
+            f"incident_{secrets.token_hex(4)}_"
+            f"{time.time_ns() // 1_000_000_000}"
         )
 
-        db_incident = TrafficIncident(
-            id=incident_id,
-            type=incident_data.type.value,
-            severity=incident_data.severity.value,
-            latitude=incident_data.location.lat,
-            longitude=incident_data.location.lng,
-            description=incident_data.description,
-            address=incident_data.address,
-            affected_lanes=incident_data.affected_lanes,
-            estimated_duration=incident_data.estimated_duration,
-            reported_by=incident_data.reported_by,
-            votes_confirm=1,  # Reporter automatically confirms
+        # INSERT ... RETURNING hands back the stored row in the same round
+        # trip, so no follow-up SELECT is needed after commit
+        result = await self.db.execute(
+            insert(TrafficIncident)
+            .values(
+                id=incident_id,
+                type=incident_data.type.value,
+                severity=incident_data.severity.value,
+                latitude=incident_data.location.lat,
+                longitude=incident_data.location.lng,
+                description=incident_data.description,
+                address=incident_data.address,
+                affected_lanes=incident_data.affected_lanes,
+                estimated_duration=incident_data.estimated_duration,
+                reported_by=incident_data.reported_by,
+                votes_confirm=1,  # Reporter automatically confirms
+            )
+            .returning(*_INCIDENT_COLUMNS)
         )
-
-        self.db.add(db_incident)
-        self.db.commit()
-        self.db.refresh(db_incident)
+        db_incident = result.one()
+        await self.db.commit()
 
         return db_incident
 
-    def get_incident(self, incident_id: str) -> Optional[TrafficIncident]:
+    async def get_incident(
+        self, incident_id: str
+    ) -> Optional[TrafficIncident]:
         """Get a specific incident by ID"""
-        return (
-            self.db.query(TrafficIncident)
-            .filter(TrafficIncident.id == incident_id)
-            .first()
-        )
+        return await self.db.get(TrafficIncident, incident_id)
 
-    def get_incidents_by_location(
+    async def get_incidents_by_location(
         self,
         latitude: float,
         longitude: float,
         radius_km: float = 10.0,
         status_filter: Optional[List[str]] = None,
         limit: int = 100,
-    ) -> List[TrafficIncident]:
+    ) -> List[Row]:
         """Get incidents within a specified radius of a location"""
 
         # Convert radius to approximate degree offset (rough calculation)
         degree_offset = radius_km / 111.0  # 1 degree ≈ 111 km
 
-        query = self.db.query(TrafficIncident).filter(
+        query = select(*_INCIDENT_COLUMNS).where(
             and_(
                 TrafficIncident.latitude.between(
                     latitude - degree_offset, latitude + degree_offset
@@ -80,59 +106,72 @@ class TrafficIncidentService:
         )
 
         if status_filter:
-            query = query.filter(TrafficIncident.status.in_(status_filter))
+            query = query.where(TrafficIncident.status.in_(status_filter))
         else:
             # Default: only active incidents
-            query = query.filter(
+            query = query.where(
                 TrafficIncident.status == IncidentStatus.active.value
             )
 
-        incidents = (
-            query.order_by(TrafficIncident.created_at.desc())
-            .limit(limit)
-            .all()
+        result = await self.db.execute(
+            query.order_by(TrafficIncident.created_at.desc()).limit(limit)
+        )
+        incidents = result.all()
+
+        # Filter by exact distance using the Haversine formula. Terms that
+        # only depend on the query point are computed once, and the radius
+        # is compared against the haversine term directly:
+        # 2R * asin(sqrt(a)) <= radius  <=>  a <= sin(radius / 2R) ** 2
+        lat1 = math.radians(latitude)
+        lon1 = math.radians(longitude)
+        cos_lat1 = math.cos(lat1)
+        max_a = (
+            math.sin(min(radius_km / (2 * EARTH_RADIUS_KM), math.pi / 2)) ** 2
         )
 
-        # Filter by exact distance calculation
         filtered_incidents = []
         for incident in incidents:
-            distance = self._calculate_distance(
-                latitude, longitude, incident.latitude, incident.longitude
+            lat2 = math.radians(incident.latitude)
+            sin_dlat = math.sin((lat2 - lat1) / 2)
+            sin_dlon = math.sin((math.radians(incident.longitude) - lon1) / 2)
+            a = (
+                sin_dlat * sin_dlat
+                + cos_lat1 * math.cos(lat2) * sin_dlon * sin_dlon
             )
-            if distance <= radius_km:
+            if a <= max_a:
                 filtered_incidents.append(incident)
 
         return filtered_incidents
 
-    def get_all_incidents(
+    async def get_all_incidents(
         self,
         status_filter: Optional[List[str]] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> List[TrafficIncident]:
-        """Get all incidents with optional filtering"""
-        query = self.db.query(TrafficIncident)
+    ) -> AsyncResult:
+        """Get all incidents with optional filtering, streamed in batches"""
+        query = select(*_INCIDENT_COLUMNS)
 
         if status_filter:
-            query = query.filter(TrafficIncident.status.in_(status_filter))
+            query = query.where(TrafficIncident.status.in_(status_filter))
         # else:
         #     # Default: only active incidents
         #     query = query.filter(
         #         TrafficIncident.status == IncidentStatus.active.value
         #     )
 
-        return (
+        return await self.db.stream(
             query.order_by(TrafficIncident.created_at.desc())
             .offset(offset)
             .limit(limit)
-            .all()
+            .execution_options(yield_per=500)
         )
 
-    def vote_on_incident(
+    async def vote_on_incident(
         self, incident_id: str, vote_type: str, user_id: Optional[str] = None
     ):
         """Cast a vote on an incident"""
-        incident = self.get_incident(incident_id)
+        incident = await self.get_incident(incident_id)
         if not incident:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -141,16 +180,17 @@ class TrafficIncidentService:
 
         # Check if user has already voted (if user_id provided)
         if user_id:
-            existing_vote = (
-                self.db.query(IncidentVote)
-                .filter(
+            result = await self.db.execute(
+                select(IncidentVote)
+                .where(
                     and_(
                         IncidentVote.incident_id == incident_id,
                         IncidentVote.user_id == user_id,
                     )
                 )
-                .first()
+                .limit(1)
             )
+            existing_vote = result.scalars().first()
 
             if existing_vote:
                 # Update existing vote
@@ -172,9 +212,9 @@ class TrafficIncidentService:
             self.db.add(new_vote)
 
         # Update incident vote counts
-        self._update_incident_vote_counts(incident_id)
+        await self._update_incident_vote_counts(incident_id)
 
-        self.db.commit()
+        await self.db.commit()
 
         return {
             "incident_id": incident_id,
@@ -183,32 +223,32 @@ class TrafficIncidentService:
             "votes_dispute": incident.votes_dispute,
         }
 
-    def update_incident_status(
+    async def update_incident_status(
         self,
         incident_id: str,
         new_status: str,
         updated_by: Optional[str] = None,
     ) -> Optional[TrafficIncident]:
         """Update incident status"""
-        incident = self.get_incident(incident_id)
+        incident = await self.get_incident(incident_id)
         if not incident:
             return None
 
         incident.status = new_status
         incident.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(incident)
+        await self.db.commit()
+        await self.db.refresh(incident)
 
         return incident
 
-    def get_incidents_along_route(
+    async def get_incidents_along_route(
         self, route_coordinates: List[dict], buffer_km: float = 1.0
-    ) -> List[TrafficIncident]:
+    ) -> List[Row]:
         """Get incidents along a route path"""
         incidents = []
 
         for coord in route_coordinates:
-            nearby_incidents = self.get_incidents_by_location(
+            nearby_incidents = await self.get_incidents_by_location(
                 latitude=coord["lat"],
                 longitude=coord["lng"],
                 radius_km=buffer_km,
@@ -222,53 +262,33 @@ class TrafficIncidentService:
 
         return list(unique_incidents.values())
 
-    def _update_incident_vote_counts(self, incident_id: str):
+    async def _update_incident_vote_counts(self, incident_id: str):
         """Update vote counts for an incident"""
         confirm_count = (
-            self.db.query(func.count(IncidentVote.id))
-            .filter(
-                and_(
-                    IncidentVote.incident_id == incident_id,
-                    IncidentVote.vote_type == "confirm",
+            await self.db.scalar(
+                select(func.count(IncidentVote.id)).where(
+                    and_(
+                        IncidentVote.incident_id == incident_id,
+                        IncidentVote.vote_type == "confirm",
+                    )
                 )
             )
-            .scalar()
             or 0
         )
 
         dispute_count = (
-            self.db.query(func.count(IncidentVote.id))
-            .filter(
-                and_(
-                    IncidentVote.incident_id == incident_id,
-                    IncidentVote.vote_type == "dispute",
+            await self.db.scalar(
+                select(func.count(IncidentVote.id)).where(
+                    and_(
+                        IncidentVote.incident_id == incident_id,
+                        IncidentVote.vote_type == "dispute",
+                    )
                 )
             )
-            .scalar()
             or 0
         )
 
-        incident = self.get_incident(incident_id)
+        incident = await self.get_incident(incident_id)
         if incident:
             incident.votes_confirm = confirm_count
             incident.votes_dispute = dispute_count
-
-    def _calculate_distance(
-        self, lat1: float, lon1: float, lat2: float, lon2: float
-    ) -> float:
-        """Calculate distance between two coordinates using Haversine formula"""
-        R = 6371  # Earth's radius in kilometers
-
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-
-        a = math.sin(dlat / 2) * math.sin(dlat / 2) + math.cos(
-            math.radians(lat1)
-        ) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) * math.sin(
-            dlon / 2
-        )
-
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        distance = R * c
-
-        return distance
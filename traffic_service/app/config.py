@@ -0,0 +1,46 @@
+from functools import lru_cache
+from typing import List, Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Traffic service settings, read from the environment and .env"""
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_ignore_empty=True, extra="ignore"
+    )
+
+    sentry_key: Optional[str] = None
+    auto_create_tables: bool = False
+
+    # Origins allowed to make credentialed cross-origin requests; set as a
+    # JSON list, e.g. CORS_ORIGINS='["https://app.example.com"]'
+    cors_origins: List[str] = [
+        "http://localhost:3000",  # React development server
+        "http://127.0.0.1:3000",
+        "http://localhost:5173",  # Vite development server
+        "http://127.0.0.1:5173",
+        "http://localhost:8080",  # Alternative frontend ports
+        "http://127.0.0.1:8080",
+    ]
+
+    db_dev_user: str = "admin"
+    db_dev_password: str = "admin"
+    db_dev_host: str = "db"
+    db_dev_port: str = "5432"
+    db_dev_traffic_name: str = "gos_traffic"
+    db_pool_size: int = 5
+
+    @property
+    def database_url(self) -> str:
+        return (
+            f"postgresql+asyncpg://{self.db_dev_user}:{self.db_dev_password}@"
+            f"{self.db_dev_host}:{self.db_dev_port}/{self.db_dev_traffic_name}"
+        )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Parse settings once per process"""
+    return Settings()
@@ -1,55 +1,65 @@
-import json
+import atexit
 import logging
 import os
 from typing import Optional
 
-from kafka import KafkaProducer
-from kafka.errors import KafkaError
+import orjson
+from confluent_kafka import KafkaException, Producer
 
 logger = logging.getLogger(__name__)
 
 
 class KafkaProducerService:
-    _instance: Optional["KafkaProducerService"] = None
-    _producer: Optional[KafkaProducer] = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(KafkaProducerService, cls).__new__(cls)
-        return cls._instance
-
     def __init__(self):
-        if self._producer is None:
-            self._initialize_producer()
+        self._producer: Optional[Producer] = None
+        self._initialize_producer()
 
     def _initialize_producer(self):
-        """Initialize Kafka producer with retry logic"""
+        """Initialize Kafka producer backed by librdkafka"""
         broker = os.getenv("KAFKA_BROKER", "kafka:29092")
-        print(broker)
 
         try:
-            self._producer = KafkaProducer(
-                bootstrap_servers=[broker],
-                value_serializer=lambda v: json.dumps(v).encode("utf-8"),
-                key_serializer=lambda k: k.encode("utf-8") if k else None,
-                acks="all",  # Wait for all replicas to acknowledge
-                retries=3,
-                max_in_flight_requests_per_connection=1,
-                request_timeout_ms=30000,
-                api_version=(2, 5, 0),
+            self._producer = Producer(
+                {
+                    "bootstrap.servers": broker,
+                    "acks": "all",  # Wait for all replicas to acknowledge
+                    # Idempotence keeps per-partition ordering with retries
+                    "enable.idempotence": True,
+                    "retries": 3,
+                    "linger.ms": 20,
+                    "compression.type": "lz4",
+                    "request.timeout.ms": 30000,
+                }
             )
             logger.info(
                 f"Kafka producer initialized successfully. Broker: {broker}"
             )
-        except Exception as e:
+        except KafkaException as e:
             logger.error(f"Failed to initialize Kafka producer: {e}")
             self._producer = None
 
+    @staticmethod
+    def _on_delivery(err, msg):
+        """Log the delivery report for a produced message"""
+        if err is not None:
+            logger.error(
+                f"Failed to deliver message to topic '{msg.topic()}': {err}"
+            )
+            return
+
+        logger.info(
+            f"Message sent to topic '{msg.topic()}' "
+            f"[partition: {msg.partition()}, offset: {msg.offset()}]"
+        )
+
     def send_message(
         self, topic: str, message: dict, key: Optional[str] = None
     ) -> bool:
         """
-        Send a message to a Kafka topic
+        Queue a message for delivery to a Kafka topic
+
+        Delivery happens in the background; the outcome is reported
+        through the delivery callback instead of blocking the caller.
 
         Args:
             topic: Kafka topic name
@@ -57,26 +67,27 @@ class KafkaProducerService:
             key: Optional message key for partitioning
 
         Returns:
-            bool: True if message sent successfully, False otherwise
+            bool: True if message was queued successfully, False otherwise
         """
         if self._producer is None:
             logger.error("Kafka producer not initialized. Message not sent.")
             return False
 
         try:
-            future = self._producer.send(topic, value=message, key=key)
-
-            # Block until message is sent or timeout
-            record_metadata = future.get(timeout=10)
-
-            logger.info(
-                f"Message sent to topic '{topic}' "
-                f"[partition: {record_metadata.partition}, "
-                f"offset: {record_metadata.offset}]"
+            self._producer.produce(
+                topic,
+                value=orjson.dumps(message),
+                key=key,
+                on_delivery=self._on_delivery,
             )
+            # Serve delivery callbacks of earlier messages without blocking
+            self._producer.poll(0)
             return True
 
-        except KafkaError as e:
+        except BufferError as e:
+            logger.error(f"Kafka producer queue is full: {e}")
+            return False
+        except KafkaException as e:
             logger.error(f"Failed to send message to topic '{topic}': {e}")
             return False
         except Exception as e:
@@ -103,12 +114,25 @@ class KafkaProducerService:
         """Close the Kafka producer"""
         if self._producer:
             try:
-                self._producer.flush()
-                self._producer.close()
+                # Wait for queued messages to be delivered
+                self._producer.flush(10)
                 logger.info("Kafka producer closed successfully")
             except Exception as e:
                 logger.error(f"Error closing Kafka producer: {e}")
 
 
-# Singleton instance
-kafka_producer = KafkaProducerService()
+_kafka_producer: Optional[KafkaProducerService] = None
+
+
+def get_kafka_producer() -> KafkaProducerService:
+    """
+    Get the process-wide Kafka producer, creating it on first use.
+
+    The producer is built lazily in each worker process rather than at
+    import time, so forked workers never share a client connection.
+    """
+    global _kafka_producer
+    if _kafka_producer is None:
+        _kafka_producer = KafkaProducerService()
+        atexit.register(_kafka_producer.close)
+    return _kafka_producer
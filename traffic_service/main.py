@@ -1,24 +1,61 @@
+import logging
+from contextlib import asynccontextmanager
+
 import sentry_sdk
-from dotenv import dotenv_values
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from app.api.database import engine
+from app.api.database import SessionLocal, engine, warm_connection_pool
 from app.api.v1.models import Base
 from app.api.v1.routes import traffic_incidents
+from app.config import get_settings
 
-config = dotenv_values(".env")
+logger = logging.getLogger(__name__)
 
-sentry_sdk.init(
-    dsn=config.get("SENTRY_KEY"),
-    # Set traces_sample_rate to 1.0 to capture 100%
-    # of transactions for performance monitoring.
-    # We recommend adjusting this value in production,
-    traces_sample_rate=1.0,
-)
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+
+    sentry_sdk.init(
+        dsn=settings.sentry_key,
+        # Set traces_sample_rate to 1.0 to capture 100%
+        # of transactions for performance monitoring.
+        # We recommend adjusting this value in production,
+        traces_sample_rate=1.0,
+    )
+
+    # Schema is managed by Alembic; creating tables on boot is a local
+    # development convenience only
+    if settings.auto_create_tables:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    await warm_connection_pool()
+
+    yield
+
+
+class SessionCleanupMiddleware:
+    """
+    Release the request's scoped database session once the response is sent.
+
+    Written as plain ASGI middleware so the route handlers run in the same
+    task, and therefore the same session scope, as the cleanup below.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if scope["type"] == "http":
+                await SessionLocal.remove()
+
 
 app = FastAPI(
     title="Traffic Service API",
@@ -27,21 +64,59 @@ app = FastAPI(
         "real-time notifications and route-based incident detection"
     ),
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-# Add CORS middleware
+# Add CORS middleware. Browsers reject credentialed responses for a
+# wildcard origin, so origins are listed explicitly; preflights are cached
+# for a day
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=get_settings().cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
+app.add_middleware(SessionCleanupMiddleware)
+
 # Include routers
 app.include_router(router=traffic_incidents.router, prefix="/api/v1")
 
 
+# Exception handlers shared by all routes, so handlers don't need their own
+# try/except blocks. Errors use the ErrorResponse schema shape.
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(
+    request: Request, exc: StarletteHTTPException
+):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={
+            "success": False,
+            "message": str(exc.detail),
+            "detail": exc.detail,
+        },
+        headers=exc.headers,
+    )
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.exception(
+        "Unhandled error on %s %s", request.method, request.url.path
+    )
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={
+            "success": False,
+            "message": "Internal server error",
+            "detail": str(exc),
+        },
+    )
+
+
 @app.get("/")
 async def root():
     return {"message": "Traffic Service API", "version": "1.0.0"}
@@ -1,15 +1,7 @@
 from django.contrib import admin
 
-from authentication.models import *
+from authentication.models.customer import Customer
 
 from .customer_admin import CustomerAdmin
 
-register_list = (
-    (
-        Customer,
-        CustomerAdmin,
-    ),
-)
-
-for register_item in register_list:
-    admin.site.register(*register_item)
+admin.site.register(Customer, CustomerAdmin)
@@ -3,15 +3,17 @@ from django.contrib import admin
 
 class CustomerAdmin(admin.ModelAdmin):
     list_display = (
-        "id",
-        "username",
-        "email",
+        "user_id",
+        "user__username",
+        "user__email",
         "bio",
         "birth_date",
         "address",
     )
+    list_select_related = ("user",)
+    raw_id_fields = ("user",)
     search_fields = (
-        "id",
+        "user__id",
         "address",
     )
     list_filter = ("birth_date",)
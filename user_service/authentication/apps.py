@@ -3,3 +3,17 @@ from django.apps import AppConfig
 
 class AuthConfig(AppConfig):
     name = "authentication"
+
+    def ready(self):
+        # Settings already warn when the keys are missing; carry on without
+        # them so management commands (generate_jwt_keys among them) still run
+        from django.conf import settings
+
+        if settings.SIMPLE_JWT["VERIFYING_KEY"] is None:
+            return
+
+        # Parse the public key JWTValidator uses now rather than on the
+        # first request
+        from .utils import JWTKeyManager
+
+        JWTKeyManager.load_public_key()
@@ -1,8 +1,19 @@
+import logging
+import secrets
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import check_password, make_password
+from django.db.models.functions import Lower
+
+logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+# Hash of a random password, checked when no user matches so that a failed
+# lookup runs the same hasher verify path as a wrong password
+_DUMMY_PASSWORD_HASH = make_password(secrets.token_urlsafe(32))
+
 
 class EmailBackend(ModelBackend):
     """
@@ -18,31 +29,45 @@ class EmailBackend(ModelBackend):
             return None
 
         try:
-            # Look up user by email instead of username
-            user = User.objects.get(email=email)
-            print(f"Found user: {user.email}")  # Debug print
-        except User.DoesNotExist:
-            print(f"No user found with email: {email}")  # Debug print
+            user = self._get_user_by_email(email)
+        except (User.DoesNotExist, User.MultipleObjectsReturned) as e:
+            logger.debug("No unique user found for email login (%s)", e)
             # Run the default password hasher once to reduce the timing
             # difference between an existing and a non-existing user
-            User().set_password(password)
+            check_password(password, _DUMMY_PASSWORD_HASH)
             return None
         else:
             # Check if the password is correct
             if user.check_password(password):
                 if self.user_can_authenticate(user):
+                    logger.debug("Authenticated user id=%s", user.pk)
                     return user
                 else:
-                    print(
-                        f"User cannot authenticate: {user.email}"
-                    )  # Debug print
+                    logger.debug("User cannot authenticate: id=%s", user.pk)
             else:
-                print(
-                    f"Password incorrect for user: {user.email}"
-                )  # Debug print
+                logger.debug("Password incorrect for user: id=%s", user.pk)
 
         return None
 
+    def _get_user_by_email(self, email):
+        """
+        Look up the user by email, joining the customer profile so it is
+        loaded in the same query.
+
+        An exact match is tried first; only when it finds nothing is the
+        email matched case-insensitively through the LOWER(email) index.
+        Accounts created before that may share an email differing only by
+        case, and none of them can be picked safely, so that lookup raises
+        MultipleObjectsReturned.
+        """
+        users = User._default_manager.select_related("customer")
+        try:
+            return users.get(email=email)
+        except User.DoesNotExist:
+            return users.alias(email_lower=Lower("email")).get(
+                email_lower=email.lower()
+            )
+
     def get_user(self, user_id):
         """
         Get user by ID (required method for authentication backends)
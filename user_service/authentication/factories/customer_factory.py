@@ -1,16 +1,14 @@
-from faker import Faker
-from authentication.models import Customer
 import factory
 
-fake = Faker()
+from authentication.factories.user_factory import UserFactory
+from authentication.models import Customer
+
 
 class CustomerFactory(factory.django.DjangoModelFactory):
-    username =  fake.profile()['username']
-    password = fake.password()
-    email = fake.email()
-    bio = fake.text()
-    birth_date = fake.date_object()
-    address = fake.address()
+    user = factory.SubFactory(UserFactory)
+    bio = factory.Faker("text")
+    birth_date = factory.Faker("date_object")
+    address = factory.Faker("address")
 
     class Meta:
         model = Customer
@@ -0,0 +1,11 @@
+import factory
+from django.contrib.auth import get_user_model
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    username = factory.Faker("user_name")
+    password = factory.django.Password(factory.Faker("password"))
+    email = factory.Faker("email")
+
+    class Meta:
+        model = get_user_model()
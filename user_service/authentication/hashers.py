@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 hasher whose work factor is read from
+    settings.PASSWORD_HASH_ITERATIONS, falling back to Django's default.
+
+    Shares the "pbkdf2_sha256" algorithm name, so existing hashes keep
+    verifying and are upgraded on login when the iteration count changes.
+    """
+
+    @property
+    def iterations(self):
+        return (
+            getattr(settings, "PASSWORD_HASH_ITERATIONS", None)
+            or PBKDF2PasswordHasher.iterations
+        )
@@ -1,5 +1,5 @@
 """
-Management command to generate or regenerate JWT RSA keys
+Management command to generate or regenerate JWT keys
 """
 
 from django.core.management.base import BaseCommand
@@ -8,7 +8,7 @@ from authentication.utils import JWTKeyManager
 
 
 class Command(BaseCommand):
-    help = "Generate RSA key pair for JWT authentication"
+    help = "Generate the key pair for JWT authentication"
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -16,9 +16,16 @@ class Command(BaseCommand):
             action="store_true",
             help="Force regeneration of keys even if they already exist",
         )
+        parser.add_argument(
+            "--algorithm",
+            choices=["EdDSA", "RS256"],
+            default="EdDSA",
+            help="Key type to generate: Ed25519 (EdDSA) or RSA (RS256)",
+        )
 
     def handle(self, *args, **options):
         force = options.get("force", False)
+        algorithm = options.get("algorithm", "EdDSA")
 
         if force:
             self.stdout.write(
@@ -26,7 +33,9 @@ class Command(BaseCommand):
             )
 
         try:
-            result = JWTKeyManager.generate_rsa_keys(force=force)
+            result = JWTKeyManager.generate_rsa_keys(
+                force=force, algorithm=algorithm
+            )
 
             if result["status"] == "exists":
                 self.stdout.write(
@@ -38,7 +47,9 @@ class Command(BaseCommand):
                 self.stdout.write(f"Public key: {result['public_key']}")
             else:
                 self.stdout.write(
-                    self.style.SUCCESS("✓ RSA key pair generated successfully!")
+                    self.style.SUCCESS(
+                        f"✓ {algorithm} key pair generated successfully!"
+                    )
                 )
                 self.stdout.write(f"Private key: {result['private_key']}")
                 self.stdout.write(f"Public key: {result['public_key']}")
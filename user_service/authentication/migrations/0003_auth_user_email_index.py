@@ -0,0 +1,19 @@
+# Generated by Django 5.1.1 on 2026-10-15 09:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("authentication", "0002_alter_customer_address"),
+    ]
+
+    operations = [
+        # auth_user ships without an index on email, which EmailBackend
+        # looks users up by on every login
+        migrations.RunSQL(
+            sql="CREATE INDEX auth_user_email_idx ON auth_user (email);",
+            reverse_sql="DROP INDEX auth_user_email_idx;",
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.1 on 2026-10-15 12:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("authentication", "0003_auth_user_email_index"),
+    ]
+
+    operations = [
+        # Email lookups now compare LOWER(email), so the plain email index
+        # is replaced by a functional one
+        migrations.RunSQL(
+            sql=[
+                "DROP INDEX auth_user_email_idx;",
+                "CREATE INDEX auth_user_email_lower_idx "
+                "ON auth_user (LOWER(email));",
+            ],
+            reverse_sql=[
+                "DROP INDEX auth_user_email_lower_idx;",
+                "CREATE INDEX auth_user_email_idx ON auth_user (email);",
+            ],
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.1.1 on 2026-10-15 14:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("authentication", "0004_auth_user_email_lower_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Customer stops inheriting from User and becomes a profile with a
+        # one-to-one key to it. The customer table keeps its rows and primary
+        # key values; only the parent link column is renamed.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql=(
+                        "ALTER TABLE customer "
+                        "RENAME COLUMN user_ptr_id TO user_id;"
+                    ),
+                    reverse_sql=(
+                        "ALTER TABLE customer "
+                        "RENAME COLUMN user_id TO user_ptr_id;"
+                    ),
+                ),
+            ],
+            state_operations=[
+                migrations.DeleteModel(name="Customer"),
+                migrations.CreateModel(
+                    name="Customer",
+                    fields=[
+                        (
+                            "user",
+                            models.OneToOneField(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                primary_key=True,
+                                related_name="customer",
+                                serialize=False,
+                                to=settings.AUTH_USER_MODEL,
+                            ),
+                        ),
+                        (
+                            "bio",
+                            models.TextField(
+                                blank=True,
+                                max_length=500,
+                                verbose_name="Bio info",
+                            ),
+                        ),
+                        (
+                            "birth_date",
+                            models.DateField(
+                                blank=True, null=True, verbose_name="Birth date"
+                            ),
+                        ),
+                        (
+                            "address",
+                            models.CharField(
+                                blank=True,
+                                max_length=200,
+                                verbose_name="Address",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "verbose_name": "Customer",
+                        "verbose_name_plural": "Customers",
+                        "db_table": "customer",
+                    },
+                ),
+            ],
+        ),
+    ]
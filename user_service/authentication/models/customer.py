@@ -1,9 +1,15 @@
-from django.contrib.auth.models import User
+from django.conf import settings
 from django.db import models
 
 
 # Create your models here.
-class Customer(User):
+class Customer(models.Model):
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="customer",
+    )
     bio = models.TextField(verbose_name="Bio info", max_length=500, blank=True)
     birth_date = models.DateField(verbose_name="Birth date", null=True, blank=True)
     address = models.CharField(verbose_name="Address", max_length=200, blank=True)
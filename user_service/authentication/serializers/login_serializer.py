@@ -1,6 +1,12 @@
 from django.contrib.auth import authenticate
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import (
+    PasswordField,
+    TokenObtainPairSerializer,
+)
+
+from authentication.tokens import RefreshToken
+from authentication.utils import get_token_claims
 
 
 class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -10,12 +16,10 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
     """
 
     username_field = "email"
+    token_class = RefreshToken
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Remove the username field and add email field
-        self.fields.pop("username", None)
-        self.fields["email"] = serializers.EmailField(required=True)
+    email = serializers.EmailField(required=True)
+    password = PasswordField()
 
     def validate(self, attrs):
         email = attrs.get("email")
@@ -43,15 +47,19 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
             # Generate tokens using the parent class method
             refresh = self.get_token(user)
             access_token = refresh.access_token
+            access_payload = access_token.payload
+            refresh_payload = refresh.payload
+            date_joined = user.date_joined.isoformat()
+            last_login = user.last_login and user.last_login.isoformat()
 
             return {
                 "refresh": str(refresh),
                 "access": str(access_token),
                 "token_type": "Bearer",
-                "expires_in": access_token.payload["exp"]
-                - access_token.payload["iat"],  # Token lifetime in seconds
-                "refresh_expires_in": refresh.payload["exp"]
-                - refresh.payload["iat"],  # Refresh token lifetime
+                # Token lifetimes in seconds
+                "expires_in": access_payload["exp"] - access_payload["iat"],
+                "refresh_expires_in": refresh_payload["exp"]
+                - refresh_payload["iat"],
                 "user": {
                     "id": user.id,
                     "email": user.email,
@@ -60,10 +68,8 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
                     "last_name": user.last_name,
                     "is_active": user.is_active,
                     "is_staff": user.is_staff,
-                    "date_joined": user.date_joined.isoformat(),
-                    "last_login": user.last_login.isoformat()
-                    if user.last_login
-                    else None,
+                    "date_joined": date_joined,
+                    "last_login": last_login,
                 },
             }
         else:
@@ -79,11 +85,6 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
         token = super().get_token(user)
 
         # Add custom claims to the token
-        token["email"] = user.email
-        token["first_name"] = user.first_name
-        token["last_name"] = user.last_name
-        token["username"] = user.username
-        token["is_staff"] = user.is_staff
-        token["user_id"] = user.id
+        token.payload.update(get_token_claims(user))
 
         return token
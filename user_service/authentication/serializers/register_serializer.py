@@ -1,8 +1,16 @@
+import re
+
+from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from authentication.models import Customer
+from authentication.tokens import RefreshToken
+from authentication.utils import get_token_claims
+
+User = get_user_model()
 
 
 class RegisterSerializer(serializers.ModelSerializer):
@@ -21,6 +29,14 @@ class RegisterSerializer(serializers.ModelSerializer):
         write_only=True, required=True, validators=[validate_password]
     )
 
+    # Account fields live on the User, not on the Customer profile
+    first_name = serializers.CharField(
+        required=False, allow_blank=True, max_length=150
+    )
+    last_name = serializers.CharField(
+        required=False, allow_blank=True, max_length=150
+    )
+
     class Meta:
         model = Customer
         fields = (
@@ -41,7 +57,7 @@ class RegisterSerializer(serializers.ModelSerializer):
         if (
             value and value.strip()
         ):  # Only validate if username is provided and not just whitespace
-            if Customer.objects.filter(username=value).exists():
+            if User.objects.filter(username=value).exists():
                 raise serializers.ValidationError(
                     "This username is already taken."
                 )
@@ -49,9 +65,14 @@ class RegisterSerializer(serializers.ModelSerializer):
 
     def validate_email(self, value):
         """
-        Ensure email is unique
+        Normalize the email to lowercase and ensure it is unique
         """
-        if Customer.objects.filter(email=value).exists():
+        value = value.strip().lower()
+        if (
+            User.objects.alias(email_lower=Lower("email"))
+            .filter(email_lower=value)
+            .exists()
+        ):
             raise serializers.ValidationError(
                 "This email is already registered."
             )
@@ -62,45 +83,59 @@ class RegisterSerializer(serializers.ModelSerializer):
         if not validated_data.get("username"):
             email = validated_data["email"]
             base_username = email.split("@")[0]
-            username = base_username
 
-            # Ensure username is unique by appending numbers if needed
+            # Ensure username is unique by appending numbers if needed,
+            # checking against the taken candidates (the base name followed
+            # only by digits) fetched in one query
+            taken = set(
+                User.objects.filter(
+                    username__regex=rf"^{re.escape(base_username)}\d*$"
+                ).values_list("username", flat=True)
+            )
+            username = base_username
             counter = 1
-            while Customer.objects.filter(username=username).exists():
+            while username in taken:
                 username = f"{base_username}{counter}"
                 counter += 1
 
             validated_data["username"] = username
 
-        user = Customer.objects.create(**validated_data)
-
-        user.set_password(validated_data["password"])
-        user.save()
+        password = validated_data.pop("password")
+        profile_data = {
+            field: validated_data.pop(field)
+            for field in ("bio", "birth_date", "address")
+            if field in validated_data
+        }
+        user = User(**validated_data)
+        user.set_password(password)
+
+        # The unique constraint on username is the final check, in case a
+        # concurrent registration took the same name since the lookup above
+        try:
+            with transaction.atomic():
+                user.save()
+                customer = Customer.objects.create(user=user, **profile_data)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {"username": "This username is already taken."}
+            )
 
-        return user
+        return customer
 
     def to_representation(self, instance):
         """
         Override to return tokens and user data after registration
         """
+        user = instance.user
+
         # Generate tokens for the newly created user
-        refresh = RefreshToken.for_user(instance)
+        refresh = RefreshToken.for_user(user)
         access_token = refresh.access_token
 
         # Add custom claims to tokens
-        refresh["email"] = instance.email
-        refresh["first_name"] = instance.first_name
-        refresh["last_name"] = instance.last_name
-        refresh["username"] = instance.username
-        refresh["is_staff"] = instance.is_staff
-        refresh["user_id"] = instance.id
-
-        access_token["email"] = instance.email
-        access_token["first_name"] = instance.first_name
-        access_token["last_name"] = instance.last_name
-        access_token["username"] = instance.username
-        access_token["is_staff"] = instance.is_staff
-        access_token["user_id"] = instance.id
+        claims = get_token_claims(user)
+        refresh.payload.update(claims)
+        access_token.payload.update(claims)
 
         return {
             "message": "User registered successfully",
@@ -112,18 +147,18 @@ class RegisterSerializer(serializers.ModelSerializer):
             "refresh_expires_in": refresh.payload["exp"]
             - refresh.payload["iat"],
             "user": {
-                "id": instance.id,
-                "email": instance.email,
-                "username": instance.username,
-                "first_name": instance.first_name,
-                "last_name": instance.last_name,
+                "id": user.id,
+                "email": user.email,
+                "username": user.username,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
                 "bio": instance.bio,
                 "birth_date": instance.birth_date.isoformat()
                 if instance.birth_date
                 else None,
                 "address": instance.address,
-                "is_active": instance.is_active,
-                "is_staff": instance.is_staff,
-                "date_joined": instance.date_joined.isoformat(),
+                "is_active": user.is_active,
+                "is_staff": user.is_staff,
+                "date_joined": user.date_joined.isoformat(),
             },
         }
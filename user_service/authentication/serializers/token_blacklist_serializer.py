@@ -0,0 +1,14 @@
+from rest_framework_simplejwt.serializers import (
+    TokenBlacklistSerializer as BaseTokenBlacklistSerializer,
+)
+
+from authentication.tokens import RefreshToken
+
+
+class TokenBlacklistSerializer(BaseTokenBlacklistSerializer):
+    """
+    Logout serializer that reads refresh tokens through the project's
+    token backend
+    """
+
+    token_class = RefreshToken
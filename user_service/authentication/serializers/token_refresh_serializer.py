@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenRefreshSerializer
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from authentication.models import Customer
+from authentication.tokens import RefreshToken
+from authentication.utils import get_token_claims
 
 
 class CustomTokenRefreshSerializer(TokenRefreshSerializer):
@@ -10,8 +11,10 @@ class CustomTokenRefreshSerializer(TokenRefreshSerializer):
     Custom token refresh serializer that returns additional token information
     """
 
+    token_class = RefreshToken
+
     def validate(self, attrs):
-        refresh = RefreshToken(attrs["refresh"])
+        refresh = self.token_class(attrs["refresh"])
 
         # Get user from token
         user_id = refresh.payload.get("user_id")
@@ -19,20 +22,16 @@ class CustomTokenRefreshSerializer(TokenRefreshSerializer):
             raise serializers.ValidationError("Invalid refresh token")
 
         try:
-            user = Customer.objects.get(id=user_id)
+            customer = Customer.objects.select_related("user").get(pk=user_id)
         except Customer.DoesNotExist:
             raise serializers.ValidationError("User not found")
+        user = customer.user
 
         # Generate new access token
         access_token = refresh.access_token
 
         # Add custom claims to the new access token
-        access_token["email"] = user.email
-        access_token["first_name"] = user.first_name
-        access_token["last_name"] = user.last_name
-        access_token["username"] = user.username
-        access_token["is_staff"] = user.is_staff
-        access_token["user_id"] = user.id
+        access_token.payload.update(get_token_claims(user))
 
         return {
             "access": str(access_token),
@@ -0,0 +1,148 @@
+import time
+import uuid
+from unittest import mock
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from django.test import SimpleTestCase
+from rest_framework_simplejwt.settings import api_settings
+
+from authentication.views.token_verify_view import _verify_access_token_cached
+
+_URL = "/api/v1/auth/token/verify/"
+
+
+class TokenVerifyTests:
+    """
+    Rejection paths of TokenVerifyView, run once per signing algorithm
+    """
+
+    algorithm = None
+
+    @classmethod
+    def generate_private_key(cls):
+        raise NotImplementedError
+
+    @classmethod
+    def setUpClass(cls):
+        cls.private_key = cls.generate_private_key()
+        # The view reads the api_settings instance it imported, which
+        # override_settings would replace rather than update
+        cls.enterClassContext(
+            mock.patch.multiple(
+                api_settings,
+                ALGORITHM=cls.algorithm,
+                VERIFYING_KEY=cls.private_key.public_key(),
+            )
+        )
+        super().setUpClass()
+
+    def setUp(self):
+        _verify_access_token_cached.cache_clear()
+
+    def make_token(self, key=None, algorithm=None, **claims):
+        payload = {
+            "token_type": "access",
+            "exp": int(time.time()) + 300,
+            "jti": uuid.uuid4().hex,
+            "user_id": 42,
+            **claims,
+        }
+        return jwt.encode(
+            payload,
+            key if key is not None else self.private_key,
+            algorithm=algorithm or self.algorithm,
+        )
+
+    def verify(self, token):
+        return self.client.post(
+            _URL, {"token": token}, content_type="application/json"
+        )
+
+    def assertRejected(self, response):
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json(), {"valid": False, "user_id": None})
+
+    def test_valid_token(self):
+        response = self.client.get(
+            _URL, HTTP_AUTHORIZATION=f"Bearer {self.make_token()}"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"valid": True, "user_id": 42})
+        self.assertEqual(response["X-User-ID"], "42")
+
+    def test_rejects_algorithm_mismatch(self):
+        token = self.make_token(key="secret", algorithm="HS256")
+
+        self.assertRejected(self.verify(token))
+
+    def test_rejects_tampered_signature(self):
+        header, payload, signature = self.make_token().split(".")
+        tampered = signature[:-4] + (
+            "AAAA" if signature[-4:] != "AAAA" else "BBBB"
+        )
+
+        self.assertRejected(self.verify(f"{header}.{payload}.{tampered}"))
+
+    def test_rejects_tampered_payload(self):
+        header, _, signature = self.make_token().split(".")
+        _, payload, _ = self.make_token(user_id=1).split(".")
+
+        self.assertRejected(self.verify(f"{header}.{payload}.{signature}"))
+
+    def test_rejects_expired_token(self):
+        token = self.make_token(exp=int(time.time()) - 1)
+
+        self.assertRejected(self.verify(token))
+
+    def test_rejects_refresh_token(self):
+        token = self.make_token(token_type="refresh")
+
+        self.assertRejected(self.verify(token))
+
+    def test_rejects_malformed_token(self):
+        for token in ("garbage", "a.b.c", "a.b", f"{self.make_token()}.x"):
+            with self.subTest(token=token):
+                self.assertRejected(self.verify(token))
+
+    def test_rejects_missing_token(self):
+        self.assertRejected(self.client.get(_URL))
+        self.assertRejected(self.client.get(_URL, HTTP_AUTHORIZATION="Bearer "))
+        self.assertRejected(self.verify(""))
+
+    def test_cached_token_rejected_after_expiry(self):
+        exp = int(time.time()) + 300
+        token = self.make_token(exp=exp)
+        self.assertEqual(self.verify(token).status_code, 200)
+
+        with mock.patch("time.time", return_value=exp + 1):
+            self.assertRejected(self.verify(token))
+
+        self.assertEqual(_verify_access_token_cached.cache_info().hits, 1)
+
+    def test_failed_verification_is_not_cached(self):
+        token = self.make_token(token_type="refresh")
+
+        self.assertRejected(self.verify(token))
+        self.assertRejected(self.verify(token))
+
+        cache_info = _verify_access_token_cached.cache_info()
+        self.assertEqual(cache_info.currsize, 0)
+        self.assertEqual(cache_info.misses, 2)
+
+
+class TestTokenVerifyEdDSA(TokenVerifyTests, SimpleTestCase):
+    algorithm = "EdDSA"
+
+    @classmethod
+    def generate_private_key(cls):
+        return ed25519.Ed25519PrivateKey.generate()
+
+
+class TestTokenVerifyRS256(TokenVerifyTests, SimpleTestCase):
+    algorithm = "RS256"
+
+    @classmethod
+    def generate_private_key(cls):
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
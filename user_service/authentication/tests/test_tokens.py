@@ -0,0 +1,38 @@
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase
+from rest_framework_simplejwt.exceptions import TokenError
+
+from authentication.tokens import AccessToken, EdDSATokenBackend
+
+
+class TestEdDSATokens(SimpleTestCase):
+    def setUp(self):
+        self.private_key = ed25519.Ed25519PrivateKey.generate()
+        backend = EdDSATokenBackend(
+            "EdDSA", self.private_key, self.private_key.public_key()
+        )
+
+        class EdDSAAccessToken(AccessToken):
+            _token_backend = backend
+
+        self.token_class = EdDSAAccessToken
+
+    def test_issue_and_verify(self):
+        token = str(self.token_class.for_user(User(id=42)))
+
+        self.assertEqual(self.token_class(token)["user_id"], 42)
+
+    def test_rejects_token_signed_with_other_key(self):
+        other_key = ed25519.Ed25519PrivateKey.generate()
+        other_backend = EdDSATokenBackend(
+            "EdDSA", other_key, other_key.public_key()
+        )
+
+        class OtherAccessToken(AccessToken):
+            _token_backend = other_backend
+
+        token = str(OtherAccessToken.for_user(User(id=42)))
+
+        with self.assertRaises(TokenError):
+            self.token_class(token)
@@ -1,26 +1,42 @@
+from django.contrib.auth.hashers import MD5PasswordHasher, make_password
 from django.contrib.auth.models import User
-from authentication.factories.customer_factory import CustomerFactory
-from django.test import TestCase
-from rest_framework_simplejwt.tokens import RefreshToken
+from django.test import TestCase, override_settings
+from authentication.tokens import RefreshToken
 from authentication.models import Customer
 from faker import Faker
 
 fake = Faker()
 
+# Hashed once per test run with the same hasher the tests are configured for
+_PASSWORD = fake.password()
+_PASSWORD_HASH = make_password(_PASSWORD, hasher=MD5PasswordHasher())
+
+
+# Password hashing dominates these tests and its strength is irrelevant here
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
 class TestCalls(TestCase):
     @classmethod
     def setUpTestData(cls):
-        cls.password = fake.password()
-        cls.username = fake.profile()["username"]
+        cls.password = _PASSWORD
+        cls.username = fake.user_name()
         cls.email = fake.email()
-        cls.customer = User.objects.create_user(
-            username=cls.username,
-            password=cls.password,
-            email=cls.email,
+        [cls.user] = User.objects.bulk_create(
+            [
+                User(
+                    username=cls.username,
+                    password=_PASSWORD_HASH,
+                    email=cls.email,
+                )
+            ]
+        )
+        [cls.customer] = Customer.objects.bulk_create(
+            [Customer(user=cls.user)]
         )
 
     def test_call_register(self):
-        user_name = fake.profile()["username"]
+        user_name = fake.user_name()
         data = {
             "username": user_name,
             "password": fake.password(),
@@ -32,12 +48,16 @@ class TestCalls(TestCase):
         )
 
         self.assertEqual(response.status_code, 201)
-        self.assertIn("username", response.json())
-        self.assertIn("email", response.json())
-        self.assertEqual(response.json().get("username"), user_name)
+        self.assertIn("access", response.json())
+        self.assertIn("refresh", response.json())
+        self.assertEqual(response.json()["user"]["username"], user_name)
+        self.assertEqual(response.json()["user"]["email"], data["email"])
+        self.assertTrue(
+            Customer.objects.filter(user__username=user_name).exists()
+        )
 
     def test_call_login(self):
-        data = {"username": TestCalls.username, "password": TestCalls.password}
+        data = {"email": TestCalls.email, "password": TestCalls.password}
 
         response = self.client.post(
             "/api/v1/auth/login/", data, content_type="application/json"
@@ -45,9 +65,30 @@ class TestCalls(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn("access", response.json())
         self.assertIn("refresh", response.json())
+        self.assertEqual(response.json()["user"]["id"], TestCalls.user.pk)
+
+    def test_call_login_email_case_insensitive(self):
+        data = {
+            "email": TestCalls.email.upper(),
+            "password": TestCalls.password,
+        }
+
+        response = self.client.post(
+            "/api/v1/auth/login/", data, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_call_login_wrong_password(self):
+        data = {"email": TestCalls.email, "password": "wrong-password"}
+
+        response = self.client.post(
+            "/api/v1/auth/login/", data, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn("access", response.json())
 
     def test_call_refresh_token(self):
-        refresh = RefreshToken.for_user(TestCalls.customer)
+        refresh = RefreshToken.for_user(TestCalls.user)
         data = {
             "refresh": str(refresh),
         }
@@ -0,0 +1,41 @@
+"""
+Token classes signed and verified through a TokenBackend that accepts EdDSA
+"""
+
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.settings import api_settings
+
+
+class EdDSATokenBackend(TokenBackend):
+    """
+    TokenBackend that also accepts EdDSA (Ed25519).
+
+    PyJWT signs and verifies EdDSA tokens, but simplejwt 5.3 leaves it out
+    of the algorithms its TokenBackend accepts.
+    """
+
+    def _validate_algorithm(self, algorithm: str) -> None:
+        if algorithm != "EdDSA":
+            super()._validate_algorithm(algorithm)
+
+
+token_backend = EdDSATokenBackend(
+    api_settings.ALGORITHM,
+    api_settings.SIGNING_KEY,
+    api_settings.VERIFYING_KEY,
+    api_settings.AUDIENCE,
+    api_settings.ISSUER,
+    api_settings.JWK_URL,
+    api_settings.LEEWAY,
+    api_settings.JSON_ENCODER,
+)
+
+
+class AccessToken(tokens.AccessToken):
+    _token_backend = token_backend
+
+
+class RefreshToken(tokens.RefreshToken):
+    _token_backend = token_backend
+    access_token_class = AccessToken
@@ -6,10 +6,14 @@ from .jwt_utils import (
     JWTKeyManager,
     JWTValidator,
     ensure_jwt_keys,
+    get_key_algorithm,
+    get_token_claims,
 )
 
 __all__ = [
     "JWTKeyManager",
     "JWTValidator",
     "ensure_jwt_keys",
+    "get_key_algorithm",
+    "get_token_claims",
 ]
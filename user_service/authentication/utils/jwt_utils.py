@@ -1,35 +1,60 @@
 """
-JWT Utilities for RSA key management and token validation
+JWT Utilities for key management and token validation
 """
 
+import logging
 import os
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
 import jwt
+import orjson
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric.types import (
+    PrivateKeyTypes,
+    PublicKeyTypes,
+)
 from django.conf import settings
+from jwt.utils import base64url_decode
+
+logger = logging.getLogger(__name__)
 
 
 class JWTKeyManager:
-    """Manage RSA keys for JWT authentication"""
+    """Manage the signing keys for JWT authentication"""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_keys_directory() -> Path:
-        """Get the directory where JWT keys are stored"""
-        keys_dir = Path(settings.BASE_DIR) / "keys"
+        """
+        Get the directory where JWT keys are stored.
+
+        This is the directory settings load the keys from (JWT_KEYS_DIR),
+        resolved and created once per process.
+        """
+        keys_dir = Path(settings.JWT_PRIVATE_KEY_PATH).parent
         keys_dir.mkdir(exist_ok=True)
         return keys_dir
 
     @staticmethod
-    def generate_rsa_keys(force: bool = False) -> Dict[str, str]:
+    def generate_rsa_keys(
+        force: bool = False, algorithm: str = "EdDSA"
+    ) -> Dict[str, str]:
         """
-        Generate RSA key pair for JWT authentication.
+        Generate the key pair for JWT authentication.
 
         Args:
             force: If True, overwrite existing keys
+            algorithm: "EdDSA" for an Ed25519 pair (smaller tokens and
+                faster verification), or "RS256" for an RSA pair of
+                settings.JWT_RSA_KEY_SIZE bits
+
+        Generation is a one-off cost at startup; it has no effect on the
+        cost of signing or verifying tokens afterwards.
 
         Returns:
             Dict with paths to private and public keys
@@ -47,9 +72,16 @@ class JWTKeyManager:
             }
 
         # Generate private key
-        private_key = rsa.generate_private_key(
-            public_exponent=65537, key_size=2048, backend=default_backend()
-        )
+        if algorithm == "EdDSA":
+            private_key = ed25519.Ed25519PrivateKey.generate()
+        elif algorithm == "RS256":
+            private_key = rsa.generate_private_key(
+                public_exponent=65537,
+                key_size=getattr(settings, "JWT_RSA_KEY_SIZE", 2048),
+                backend=default_backend(),
+            )
+        else:
+            raise ValueError(f"Unsupported algorithm: {algorithm}")
 
         # Serialize private key
         private_pem = private_key.private_bytes(
@@ -67,17 +99,23 @@ class JWTKeyManager:
             format=serialization.PublicFormat.SubjectPublicKeyInfo,
         )
 
-        # Write keys to files
-        with open(private_key_path, "wb") as f:
+        # Write keys to files. The private key is created with owner-only
+        # permissions, so it is never readable by others, even briefly.
+        private_key_path.unlink(missing_ok=True)
+        fd = os.open(
+            private_key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600
+        )
+        with os.fdopen(fd, "wb") as f:
             f.write(private_pem)
 
         with open(public_key_path, "wb") as f:
             f.write(public_pem)
-
-        # Set permissions
-        os.chmod(private_key_path, 0o600)
         os.chmod(public_key_path, 0o644)
 
+        # Drop keys cached by this process so the new pair is picked up
+        JWTKeyManager.load_private_key.cache_clear()
+        JWTKeyManager.load_public_key.cache_clear()
+
         return {
             "private_key": str(private_key_path),
             "public_key": str(public_key_path),
@@ -85,26 +123,40 @@ class JWTKeyManager:
         }
 
     @staticmethod
-    def load_private_key() -> Optional[str]:
-        """Load the private key from file"""
+    @lru_cache(maxsize=1)
+    def load_private_key() -> Optional[PrivateKeyTypes]:
+        """
+        Load the private key from file, parsed into a key object.
+
+        The key is read once per process; other processes pick up
+        regenerated keys on restart.
+        """
         keys_dir = JWTKeyManager.get_keys_directory()
         private_key_path = keys_dir / "jwt_private_key.pem"
 
         try:
-            with open(private_key_path, "r") as f:
-                return f.read()
+            with open(private_key_path, "rb") as f:
+                return serialization.load_pem_private_key(
+                    f.read(), password=None
+                )
         except FileNotFoundError:
             return None
 
     @staticmethod
-    def load_public_key() -> Optional[str]:
-        """Load the public key from file"""
+    @lru_cache(maxsize=1)
+    def load_public_key() -> Optional[PublicKeyTypes]:
+        """
+        Load the public key from file, parsed into a key object.
+
+        The key is read once per process; other processes pick up
+        regenerated keys on restart.
+        """
         keys_dir = JWTKeyManager.get_keys_directory()
         public_key_path = keys_dir / "jwt_public_key.pem"
 
         try:
-            with open(public_key_path, "r") as f:
-                return f.read()
+            with open(public_key_path, "rb") as f:
+                return serialization.load_pem_public_key(f.read())
         except FileNotFoundError:
             return None
 
@@ -142,7 +194,7 @@ class JWTValidator:
                 decoded = jwt.decode(
                     token,
                     public_key,
-                    algorithms=["RS256"],
+                    algorithms=[get_key_algorithm(public_key)],
                     options={"verify_signature": True},
                 )
             else:
@@ -150,10 +202,10 @@ class JWTValidator:
 
             return decoded
         except jwt.ExpiredSignatureError:
-            print("Token has expired")
+            logger.debug("Token has expired")
             return None
         except jwt.InvalidTokenError as e:
-            print(f"Invalid token: {e}")
+            logger.debug("Invalid token: %s", e)
             return None
 
     @staticmethod
@@ -169,8 +221,13 @@ class JWTValidator:
             Dict with token information
         """
         try:
-            decoded = jwt.decode(token, options={"verify_signature": False})
-            header = jwt.get_unverified_header(token)
+            # Decode each segment once rather than parsing the whole token
+            # for the payload and again for the header
+            header_b64, payload_b64, _ = token.split(".")
+            header = orjson.loads(base64url_decode(header_b64))
+            decoded = orjson.loads(base64url_decode(payload_b64))
+            if not isinstance(header, dict) or not isinstance(decoded, dict):
+                raise ValueError("Invalid token segments")
 
             return {
                 "valid": True,
@@ -201,23 +258,43 @@ class JWTValidator:
             decoded = jwt.decode(token, options={"verify_signature": False})
             exp = decoded.get("exp")
             if exp:
-                import time
-
                 return time.time() > exp
             return False
         except Exception:
             return True
 
 
+def get_key_algorithm(key) -> str:
+    """JWT algorithm to use with a loaded private or public key"""
+    if isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+        return "EdDSA"
+    return "RS256"
+
+
+def get_token_claims(user) -> Dict:
+    """Custom claims added to the tokens issued for a user"""
+    return {
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "username": user.username,
+        "is_staff": user.is_staff,
+        "user_id": user.id,
+    }
+
+
 def ensure_jwt_keys():
     """
     Ensure JWT keys exist, generate them if they don't.
     This can be called during Django startup.
     """
     if not JWTKeyManager.verify_keys_exist():
-        print("JWT keys not found. Generating new keys...")
+        logger.warning("JWT keys not found. Generating new keys...")
         result = JWTKeyManager.generate_rsa_keys()
-        print(f"✓ JWT keys generated at: {result['private_key']}")
-        print("⚠️  IMPORTANT: Keep the private key secret!")
+        logger.warning(
+            "JWT keys generated at: %s. Keep the private key secret, and "
+            "restart the service so settings load the new keys.",
+            result["private_key"],
+        )
     else:
-        print("✓ JWT keys found and loaded")
+        logger.debug("JWT keys found and loaded")
@@ -1,4 +1,11 @@
-from .login_view import *
-from .register_view import *
-from .token_refresh_view import *
-from .token_verify_view import *
+from .login_view import EmailLoginView
+from .register_view import RegisterView
+from .token_refresh_view import CustomTokenRefreshView
+from .token_verify_view import TokenVerifyView
+
+__all__ = [
+    "EmailLoginView",
+    "RegisterView",
+    "CustomTokenRefreshView",
+    "TokenVerifyView",
+]
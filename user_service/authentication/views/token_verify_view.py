@@ -1,11 +1,81 @@
-from rest_framework import status
-from rest_framework.response import Response
-from rest_framework.views import APIView
-from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import AccessToken
+import base64
+import time
+from functools import lru_cache
+from http import HTTPStatus
 
+import orjson
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework_simplejwt.settings import api_settings
 
-class TokenVerifyView(APIView):
+from authentication.tokens import AccessToken
+
+
+def _b64decode(segment):
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _json_response(data, status):
+    return HttpResponse(
+        orjson.dumps(data), content_type="application/json", status=status
+    )
+
+
+def _verify_access_token(token, public_key):
+    """
+    Verify an EdDSA or RS256 access token and return its payload.
+
+    A minimal stand-in for AccessToken(token) on the verify hot path: the
+    signature is checked directly against the pre-parsed public key, along
+    with the claims SimpleJWT would check (exp, jti and token type).
+    Raises ValueError or InvalidSignature if the token is not valid.
+    """
+    header_b64, payload_b64, signature_b64 = token.split(".")
+
+    header = orjson.loads(_b64decode(header_b64))
+    if header.get("alg") != api_settings.ALGORITHM:
+        raise ValueError("Unexpected algorithm")
+
+    signature = _b64decode(signature_b64)
+    signing_input = f"{header_b64}.{payload_b64}".encode()
+    if api_settings.ALGORITHM == "EdDSA":
+        public_key.verify(signature, signing_input)
+    else:
+        public_key.verify(
+            signature, signing_input, padding.PKCS1v15(), hashes.SHA256()
+        )
+
+    payload = orjson.loads(_b64decode(payload_b64))
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)) or time.time() > exp:
+        raise ValueError("Token is expired")
+    if api_settings.JTI_CLAIM not in payload:
+        raise ValueError("Token has no id")
+    if payload.get(api_settings.TOKEN_TYPE_CLAIM) != AccessToken.token_type:
+        raise ValueError("Token has wrong type")
+
+    return payload
+
+
+@lru_cache(maxsize=10000)
+def _verify_access_token_cached(token):
+    """
+    Verify a token once per process and remember its (user_id, exp).
+
+    Traefik presents the same access token on every request a client makes
+    during its lifetime, so later checks only need the expiry compared
+    again. Invalid tokens raise and are never cached.
+    """
+    payload = _verify_access_token(token, api_settings.VERIFYING_KEY)
+    return payload.get("user_id"), payload["exp"]
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class TokenVerifyView(View):
     """
     API endpoint to verify JWT access token
     via either POST body (client) or Authorization header (Traefik).
@@ -13,53 +83,57 @@ class TokenVerifyView(APIView):
     Supports:
     - POST /api/auth/token/verify/  (Body: {"token": "..."})
     - GET /api/auth/token/verify/   (Header: Authorization: Bearer <token>)
-    """
 
-    permission_classes = []
-    authentication_classes = []
+    This is a plain Django view rather than a DRF APIView: it runs on every
+    forwarded request and needs none of DRF's parsing, negotiation or
+    authentication machinery.
+    """
 
     def get_token_from_request(self, request):
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            return auth_header.split(" ", 1)[1]
+        auth_header = request.META.get("HTTP_AUTHORIZATION")
+        if auth_header and auth_header[:7] == "Bearer ":
+            return auth_header[7:]
+
+        if request.method != "POST":
+            return None
 
-        if hasattr(request, "data"):
-            return request.data.get("token")
+        if request.content_type == "application/json":
+            try:
+                data = orjson.loads(request.body)
+            except ValueError:
+                return None
+            return data.get("token") if isinstance(data, dict) else None
 
-        return None
+        return request.POST.get("token")
 
     def verify_token(self, token):
         if not token:
             return {
                 "valid": False,
                 "user_id": None,
-            }, status.HTTP_401_UNAUTHORIZED
+            }, HTTPStatus.UNAUTHORIZED
 
         try:
-            access_token = AccessToken(token)
-            user_id = access_token.get("user_id")
-            return {"valid": True, "user_id": user_id}, status.HTTP_200_OK
-        except TokenError:
-            return {
-                "valid": False,
-                "user_id": None,
-            }, status.HTTP_401_UNAUTHORIZED
+            user_id, exp = _verify_access_token_cached(token)
+            if time.time() > exp:
+                raise ValueError("Token is expired")
+            return {"valid": True, "user_id": user_id}, HTTPStatus.OK
         except Exception:
             return {
                 "valid": False,
                 "user_id": None,
-            }, status.HTTP_401_UNAUTHORIZED
+            }, HTTPStatus.UNAUTHORIZED
 
     def post(self, request):
         token = self.get_token_from_request(request)
         result, code = self.verify_token(token)
-        return Response(result, status=code)
+        return _json_response(result, code)
 
     def get(self, request):
         token = self.get_token_from_request(request)
         result, code = self.verify_token(token)
 
-        response = Response(result, status=code)
+        response = _json_response(result, code)
         if result["valid"]:
             response["X-User-ID"] = str(result["user_id"])
         return response
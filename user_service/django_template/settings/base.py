@@ -14,6 +14,8 @@ import os
 from datetime import timedelta
 
 from celery.schedules import crontab
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -67,14 +69,23 @@ INSTALLED_APPS = [
 ]
 
 # JWT RSA Keys Configuration
-keys_dir = os.environ.get("JWT_KEYS_DIR", os.path.join(BASE_DIR, "keys"))
+# Defaults to user_service/keys, where generate_rsa_keys.py writes them
+keys_dir = os.environ.get(
+    "JWT_KEYS_DIR", os.path.join(os.path.dirname(BASE_DIR), "keys")
+)
 JWT_PRIVATE_KEY_PATH = os.path.join(keys_dir, "jwt_private_key.pem")
 JWT_PUBLIC_KEY_PATH = os.path.join(keys_dir, "jwt_public_key.pem")
+# Size of newly generated RSA keys, when RS256 is chosen over Ed25519
+JWT_RSA_KEY_SIZE = int(os.getenv("JWT_RSA_KEY_SIZE", 2048))
 
-# Load RSA keys if they exist
+# Load RSA keys if they exist. They are parsed into key objects once here,
+# so PyJWT signs and verifies with them directly instead of re-parsing the
+# PEM for every token simplejwt issues or checks.
 try:
-    with open(JWT_PRIVATE_KEY_PATH, "r") as f:
-        JWT_PRIVATE_KEY = f.read()
+    with open(JWT_PRIVATE_KEY_PATH, "rb") as f:
+        JWT_PRIVATE_KEY = serialization.load_pem_private_key(
+            f.read(), password=None
+        )
 except FileNotFoundError:
     JWT_PRIVATE_KEY = None
     print(
@@ -82,15 +93,22 @@ except FileNotFoundError:
     )
 
 try:
-    with open(JWT_PUBLIC_KEY_PATH, "r") as f:
-        JWT_PUBLIC_KEY = f.read()
+    with open(JWT_PUBLIC_KEY_PATH, "rb") as f:
+        JWT_PUBLIC_KEY = serialization.load_pem_public_key(f.read())
 except FileNotFoundError:
     JWT_PUBLIC_KEY = None
     print(
         "WARNING: JWT public key not found. Run generate_rsa_keys.py to create keys."
     )
 
-# Simple JWT Configuration with RSA256
+# Sign with EdDSA when the key pair on disk is Ed25519 (the default for new
+# keys), otherwise RS256, so existing RSA keys keep working until rotated
+if isinstance(JWT_PRIVATE_KEY, ed25519.Ed25519PrivateKey):
+    JWT_ALGORITHM = "EdDSA"
+else:
+    JWT_ALGORITHM = "RS256"
+
+# Simple JWT Configuration
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(
         minutes=int(os.getenv("ACCESS_TOKEN_LIFETIME", 5))
@@ -101,8 +119,8 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "UPDATE_LAST_LOGIN": True,
-    # Use RS256 algorithm (RSA with SHA-256)
-    "ALGORITHM": "RS256",
+    # EdDSA (Ed25519) or RS256 (RSA with SHA-256), following the keys
+    "ALGORITHM": JWT_ALGORITHM,
     "SIGNING_KEY": JWT_PRIVATE_KEY,
     "VERIFYING_KEY": JWT_PUBLIC_KEY,
     # Token claims
@@ -112,12 +130,13 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
     "USER_AUTHENTICATION_RULE": "rest_framework_simplejwt.authentication.default_user_authentication_rule",
     # Token type
-    "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
+    "AUTH_TOKEN_CLASSES": ("authentication.tokens.AccessToken",),
     "TOKEN_TYPE_CLAIM": "token_type",
     # Sliding tokens (optional)
     "JTI_CLAIM": "jti",
     # Token obtain serializer
     "TOKEN_OBTAIN_SERIALIZER": "authentication.serializers.login_serializer.EmailTokenObtainPairSerializer",
+    "TOKEN_BLACKLIST_SERIALIZER": "authentication.serializers.token_blacklist_serializer.TokenBlacklistSerializer",
 }
 
 SITE_ID = 1
@@ -171,6 +190,20 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing. The PBKDF2 work factor can be tuned per deployment so a
+# single verify stays within the login latency budget on the target host;
+# leaving PASSWORD_HASH_ITERATIONS unset keeps Django's default.
+hash_iterations = int(os.getenv("PASSWORD_HASH_ITERATIONS", 0))
+PASSWORD_HASH_ITERATIONS = hash_iterations or None
+
+PASSWORD_HASHERS = [
+    "authentication.hashers.TunablePBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/2.0/topics/i18n/
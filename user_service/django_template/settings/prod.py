@@ -13,6 +13,9 @@ ALLOWED_HOSTS = [
 
 DEBUG = os.getenv("DEBUG", False)
 
+# TLS is terminated at Traefik, which sets X-Forwarded-Proto on every request
+SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
+
 STATIC_URL = "/users/static/"
 STATIC_ROOT = os.path.join(BASE_DIR, "static")
 
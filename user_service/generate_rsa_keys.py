@@ -1,18 +1,19 @@
 #!/usr/bin/env python
 """
-Script to generate RSA key pair for JWT authentication.
-This creates private and public keys in PEM format.
+Script to generate the key pair for JWT authentication.
+This creates private and public keys in PEM format: Ed25519 by default,
+or RSA when JWT_KEY_ALGORITHM=RS256 (JWT_RSA_KEY_SIZE bits, 2048 by default).
 """
 
 import os
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
 
 
 def generate_rsa_keys():
-    """Generate RSA private and public keys and save them to files."""
+    """Generate private and public keys and save them to files."""
 
     # Create keys directory if it doesn't exist
     keys_dir = os.environ.get(
@@ -25,13 +26,21 @@ def generate_rsa_keys():
 
     # Check if keys already exist
     if os.path.exists(private_key_path) and os.path.exists(public_key_path):
-        print("✓ RSA keys already exist. Skipping generation.")
+        print("✓ JWT keys already exist. Skipping generation.")
         return
 
     # Generate private key
-    private_key = rsa.generate_private_key(
-        public_exponent=65537, key_size=2048, backend=default_backend()
-    )
+    algorithm = os.environ.get("JWT_KEY_ALGORITHM", "EdDSA")
+    if algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    elif algorithm == "RS256":
+        private_key = rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=int(os.environ.get("JWT_RSA_KEY_SIZE", 2048)),
+            backend=default_backend(),
+        )
+    else:
+        raise SystemExit(f"Unsupported JWT_KEY_ALGORITHM: {algorithm}")
 
     # Serialize private key to PEM format
     private_pem = private_key.private_bytes(
@@ -49,21 +58,21 @@ def generate_rsa_keys():
         format=serialization.PublicFormat.SubjectPublicKeyInfo,
     )
 
-    # Write private key to file
-    with open(private_key_path, "wb") as f:
+    # Write private key to file, created readable by the owner only
+    if os.path.exists(private_key_path):
+        os.remove(private_key_path)
+    fd = os.open(private_key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
         f.write(private_pem)
     print(f"✓ Private key saved to: {private_key_path}")
 
     # Write public key to file
     with open(public_key_path, "wb") as f:
         f.write(public_pem)
-    print(f"✓ Public key saved to: {public_key_path}")
-
-    # Set appropriate permissions (read-only for owner)
-    os.chmod(private_key_path, 0o600)
     os.chmod(public_key_path, 0o644)
+    print(f"✓ Public key saved to: {public_key_path}")
 
-    print("\n✓ RSA key pair generated successfully!")
+    print(f"\n✓ {algorithm} key pair generated successfully!")
     print("\nIMPORTANT:")
     print("- Keep the private key (jwt_private_key.pem) SECRET")
     print("- Never commit the private key to version control")